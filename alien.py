@@ -15,7 +15,7 @@ class Alien(Sprite):
     """
     Class for aliens.
     """
-    def __init__(self, fleet: "AlienFleet", x: float, y: float):
+    def __init__(self, fleet: "AlienFleet", x: float, y: float, image: pygame.Surface):
         """
         Initializes aliens.
 
@@ -23,6 +23,7 @@ class Alien(Sprite):
             fleet (AlienFleet): Alien fleet.
             x (float): Horizontal position.
             y (float): Vertical position.
+            image (pygame.Surface): Shared image for the alien's variant.
         """
         super().__init__()
         self.fleet = fleet
@@ -30,11 +31,8 @@ class Alien(Sprite):
         self.boundaries = fleet.game.screen.get_rect()
         self.settings = fleet.game.settings
 
-        self.image = pygame.image.load(self.settings.alien_file)
-        self.image = pygame.transform.scale(self.image, 
-            (self.settings.alien_w, self.settings.alien_h)
-            )
-        
+        self.image = image
+
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
@@ -59,11 +57,3 @@ class Alien(Sprite):
             bool: True if the alien is at the edges of the screen.
         """
         return (self.rect.right >= self.boundaries.right or self.rect.left <= self.boundaries.left)
-    
-    def draw_alien(self):
-        """
-        Draws the alien on the screen.
-        """
-        self.screen.blit(self.image, self.rect)
-
-
@@ -3,37 +3,48 @@ AlienFleet module.
 
 This module creates the Alien Fleet and customizes the layout and movement.
 """
+import random
 import pygame
 from settings import Settings
 from alien import Alien
+from formations import get_formation
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from alien_invasion import AlienInvasion
+    from enemy_arsenal import EnemyArsenal
 
 class AlienFleet:
     """
     Manage the alien fleet: creation, drawing, movement, and collision logic.
     """
 
-    def __init__(self, game: 'AlienInvasion'):
+    def __init__(self, game: 'AlienInvasion', arsenal: 'EnemyArsenal'):
         """
         Initializes the AlienFleet.
 
         Args:
             game (AlienInvasion): Main game.
+            arsenal (EnemyArsenal): Arsenal for aliens firing back.
         """
         self.game = game
         self.settings = game.settings
         self.fleet = pygame.sprite.Group()
+        self.arsenal = arsenal
+        self.columns = {}
+        self.skins = {}
+        self.tier = 0
         self.fleet_direction = self.settings.fleet_direction
         self.fleet_drop_speed = self.settings.fleet_drop_speed
+        self.spawn_queue = None
 
         self.create_fleet()
 
     def create_fleet(self):
         """
-        Creates a fleet of aliens in a cross formation.
+        Starts spawning a new fleet in the formation for the current level.
+
+        The aliens are streamed in over several frames by update_fleet.
         """
         alien_w = self.settings.alien_w
         alien_h = self.settings.alien_h
@@ -43,40 +54,31 @@ class AlienFleet:
         fleet_w, fleet_h = self.calculate_fleet_size(alien_w, screen_w, alien_h, screen_h)
         x_offset, y_offset = self.calculate_offsets(alien_w, alien_h, screen_w, fleet_w, fleet_h)
 
-        self._create_cross_fleet(alien_w, alien_h, fleet_w, fleet_h, x_offset, y_offset)
-    
-    def _create_cross_fleet(self, alien_w, alien_h, fleet_w, fleet_h, x_offset, y_offset):
-        """
-        Create fleet in a cross pattern.
+        level = self.game.game_stats.level
+        formations = self.settings.fleet_formations
+        create_formation = get_formation(formations[(level - 1) % len(formations)])
+        self.tier = self.level_tier(level)
 
-        Args:
-            alien_w (int): Width of alien.
-            alien_h (int): Height of alien.
-            fleet_w (int): Number of aliens width.
-            fleet_h (int): Number of aliens width.
-            x_offset (int): X offset.
-            y_offset (int): Y offset.
-        """
-        center_col = fleet_w // 2
-        center_row = fleet_h // 2
-
-        for row in range(fleet_h):
-            for col in range(fleet_w):
-                current_x = alien_w * col + x_offset
-                current_y = alien_h * row + y_offset
+        self.fleet.empty()
+        self.columns = {}
+        self.spawn_queue = (
+            (alien_w * col + x_offset, alien_h * row + y_offset, col, row)
+            for col, row in create_formation(fleet_w, fleet_h, level)
+        )
+        self._spawn_aliens()
 
-                if row == center_row or col == center_col:
-                    self._create_alien(current_x, current_y)
-        
-
-    def _create_rectangle_fleet(self, alien_w, alien_h, fleet_w, fleet_h, x_offset, y_offset):
-        for row in range(fleet_h):
-            for col in range(fleet_w):
-                current_x = alien_w * col + x_offset
-                current_y = alien_h * row + y_offset
-                if col % 2 == 0 or row % 2 ==0:
-                    continue
-                self._create_alien(current_x, current_y)
+    def _spawn_aliens(self):
+        """
+        Creates the next batch of aliens from the spawn queue.
+        """
+        for _ in range(self.settings.fleet_spawn_rate):
+            position = next(self.spawn_queue, None)
+            if position is None:
+                self.spawn_queue = None
+                for column in self.columns.values():
+                    column.sort(key=lambda alien: alien.y)
+                return
+            self._create_alien(*position)
 
     def calculate_offsets(self, alien_w, alien_h, screen_w, fleet_w, fleet_h):
         """
@@ -129,17 +131,76 @@ class AlienFleet:
         return int(fleet_w), int(fleet_h)
 
         
-    def _create_alien(self, current_x: int, current_y: int):
+    def level_tier(self, level: int):
+        """
+        Gets the alien tier for a level.
+
+        Args:
+            level (int): Level the fleet is spawned for.
+
+        Returns:
+            int: Index into Settings.alien_tiers.
+        """
+        return (level - 1) // self.settings.alien_tier_levels % len(self.settings.alien_tiers)
+
+    def alien_image(self, row: int):
+        """
+        Returns the shared image for an alien in a row of the current fleet.
+
+        Each level tier has its own variants, used row by row. A variant is
+        tinted and scaled once, then cached by (tier, variant). The tier is
+        set once per fleet by create_fleet.
+
+        Args:
+            row (int): Row of the formation grid.
+
+        Returns:
+            pygame.Surface: The alien image.
+        """
+        tiers = self.settings.alien_tiers
+        tier = self.tier
+        variant = row % len(tiers[tier])
+        image = self.skins.get((tier, variant))
+        if image is None:
+            image = self._create_skin(*tiers[tier][variant])
+            self.skins[(tier, variant)] = image
+        return image
+
+    def _create_skin(self, file, tint, scale):
+        """
+        Creates a tinted and scaled alien image.
+
+        Args:
+            file (Path): Alien image file.
+            tint (tuple): RGB colour multiplied into the image, or None.
+            scale (float): Size relative to the alien width and height.
+
+        Returns:
+            pygame.Surface: The alien image.
+        """
+        size = (round(self.settings.alien_w * scale), round(self.settings.alien_h * scale))
+        image = self.game.display.images.get(file, size)
+        if tint:
+            image = image.copy()
+            image.fill((*tint, 255), special_flags=pygame.BLEND_RGBA_MULT)
+        return image
+
+    def _create_alien(self, current_x: int, current_y: int, col: int, row: int):
         """"
-        Creates an alien and adds it to the fleet.
+        Creates an alien and adds it to the fleet and its column.
 
         Args:
             current_x (int): X.
             current_y (int): Y.
+            col (int): Column of the formation grid.
+            row (int): Row of the formation grid.
         """
-        new_alien = Alien(self, current_x, current_y)
+        new_alien = Alien(self, current_x, current_y, self.alien_image(row))
+        new_alien.col = col
+        new_alien.row = row
 
         self.fleet.add(new_alien)
+        self.columns.setdefault(col, []).append(new_alien)
 
     
     def _check_fleet_edges(self):
@@ -164,20 +225,67 @@ class AlienFleet:
     def update_fleet(self):
         """
         Update the fleets position and direction.
+
+        The fleet holds still until every alien has been spawned.
         """
+        self.arsenal.update_arsenal()
+        if self.spawn_queue is not None:
+            self._spawn_aliens()
+            return
         self._check_fleet_edges()
         self.fleet.update()
+        self._fire_bullets()
 
-    def draw(self):
+    def _fire_bullets(self):
         """
-        Draws all aliens on the screen.
+        Randomly fires from the bottom-most alien of a column.
         """
-        alien: 'Alien'
-        for alien in self.fleet:
-            alien.draw_alien()
+        if not self.columns or random.random() >= self.settings.alien_fire_chance:
+            return
+        column = self.columns[random.choice(tuple(self.columns))]
+        self.arsenal.fire_bullet(column[-1].rect.midbottom)
+
+    def blits(self):
+        """
+        Lists what to draw for the enemy bullets and aliens.
+
+        Returns:
+            list: (image, position) pairs.
+        """
+        blits = self.arsenal.blits()
+        blits.extend((alien.image, alien.rect.topleft) for alien in self.fleet)
+        return blits
 
     def check_collisions(self, other_group):
-        return pygame.sprite.groupcollide(self.fleet, other_group, True, True)
+        """
+        Checks for collisions and removes hit aliens from their columns.
+
+        Each bullet is checked along the whole distance it moved this frame,
+        so fast bullets cannot skip past an alien between frames. A bullet
+        only hits the lowest alien it touched, the first one in its path.
+
+        Args:
+            other_group (pygame.sprite.Group): Bullets to check against.
+
+        Returns:
+            dict: Dictionary mapping aliens to the bullets that hit them.
+        """
+        aliens = self.fleet.sprites()
+        alien_rects = [alien.rect for alien in aliens]
+        collisions = {}
+        for bullet in other_group.sprites():
+            hits = bullet.swept_rect().collidelistall(alien_rects)
+            if hits:
+                index = max(hits, key=lambda index: alien_rects[index].bottom)
+                collisions.setdefault(aliens[index], []).append(bullet)
+                bullet.kill()
+        for alien in collisions:
+            alien.kill()
+            column = self.columns[alien.col]
+            column.remove(alien)
+            if not column:
+                del self.columns[alien.col]
+        return collisions
     
     def check_fleet_bottom(self):
         alien : Alien
@@ -193,5 +301,5 @@ class AlienFleet:
         Returns:
             bool: True if no aliens are left.
         """
-        return not self.fleet
+        return not self.fleet and self.spawn_queue is None
 
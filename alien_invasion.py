@@ -4,16 +4,34 @@ Alien Invasion - A game where you shoot lasers to defeat and Alien fleet.
 This is the main game loop, and controls the logic for the Alien Invasion Game.
 """
 import sys
+from time import perf_counter
+from typing import NamedTuple
+from startup import startup_timer
 import pygame
+startup_timer.mark('import pygame')
 from settings import Settings
 from ship import Ship
 from arsenal import Arsenal
 from alien import Alien
 from alien_fleet import AlienFleet
+from enemy_arsenal import EnemyArsenal
 from game_stats import GameStats
 from time import sleep
 from button import Button
 from hud import HUD
+from display import Display
+from background import Background
+from bots import read_state
+from gc_control import GCController
+from savestate import save_checkpoint, load_checkpoint, clear_checkpoint
+from governor import QualityGovernor
+from particles import ParticleEmitter
+startup_timer.mark('import game modules')
+
+class FrameSnapshot(NamedTuple):
+    """Everything needed to draw one frame, taken at the end of a simulation step."""
+    blits: tuple
+    game_active: bool
 
 class AlienInvasion:
     """Main class to manage game behavior and overall state."""
@@ -21,19 +39,16 @@ class AlienInvasion:
         """
         Initialize the game, settings, and create game components.
         """
-        pygame.init()
+        pygame.display.init()
+        pygame.font.init()
         self.settings = Settings()
         self.settings.initialize_dynamic_settings()
 
-        self.screen = pygame.display.set_mode(
-            (self.settings.screen_w, self.settings.screen_h)
-            )
-        pygame.display.set_caption(self.settings.name)
+        self.display = Display(self)
+        self.screen = self.display.screen
+        startup_timer.mark('display')
 
-        self.bg = pygame.image.load(self.settings.bg_file)
-        self.bg = pygame.transform.scale(self.bg, 
-            (self.settings.screen_w, self.settings.screen_h)
-            )
+        self.background = Background(self)
 
         self.game_stats = GameStats(self)
         self.HUD = HUD(self)
@@ -47,28 +62,136 @@ class AlienInvasion:
         
         self.impact_sound = pygame.mixer.Sound(self.settings.impact_sound)
         self.impact_sound.set_volume(0.2)
+        self.sound_cooldown = 0
+        self.last_impact = 0
+        startup_timer.mark('background, HUD and sounds')
 
         self.ship = Ship(self, Arsenal(self))
-        self.alien_fleet = AlienFleet(self)
+        self.alien_fleet = AlienFleet(self, EnemyArsenal(self))
+        self.particles = ParticleEmitter(self)
         self.alien_fleet.create_fleet()
         self.play_button = Button(self, 'Play')
+        startup_timer.mark('ship, fleet and particles')
         
         self.game_active = False
+        self.bot = None
+        self.startup_report = False
+        self.diagnostics = None
+        self.analytics = None
+        if self.settings.diagnostics:
+            from diagnostics import MemoryTracker
+            self.diagnostics = MemoryTracker(self)
+        if self.settings.analytics:
+            from analytics import EventBus
+            self.analytics = EventBus(self)
+        self.governor = QualityGovernor(self) if self.settings.quality_governor else None
+        self.gc_control = GCController(self) if self.settings.gc_control else None
 
     def run_game(self):
         """
         Starts the game loop and continues running while the game is active.
         """
+        self._run_frame()
+        startup_timer.mark('first frame')
+        if self.startup_report:
+            startup_timer.report()
+
+        if self.settings.pipelined:
+            self._run_pipelined()
+            return
         while self.running:
-            self._check_events()
-            
-            if self.game_active:
-                self.ship.update()
-                self.alien_fleet.update_fleet()
-                self._check_collisions()
-            
-            self._update_screen()
+            start = perf_counter()
+            self._run_frame()
+            self._frame_done(perf_counter() - start)
             self.clock.tick(self.settings.FPS)
+
+    def _run_pipelined(self):
+        """
+        Runs the game loop with simulation and drawing overlapped.
+
+        While the main thread draws and presents frame N, a worker thread
+        simulates frame N+1. Each side only touches its own snapshot, and
+        input is read on the main thread while the worker is idle.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            snapshot = self._simulate()
+            while self.running:
+                start = perf_counter()
+                self._check_events()
+                next_snapshot = executor.submit(self._simulate)
+                self._draw_frame(snapshot)
+                snapshot = next_snapshot.result()
+                if self.diagnostics:
+                    self.diagnostics.update()
+                self._frame_done(perf_counter() - start)
+                self.clock.tick(self.settings.FPS)
+
+    def _frame_done(self, elapsed):
+        """
+        Reports how long the frame took to the governor and GC controller.
+
+        Args:
+            elapsed (float): Seconds the frame took before waiting for the clock.
+        """
+        if self.governor:
+            self.governor.frame_done(elapsed)
+        if self.gc_control:
+            self.gc_control.frame_done(elapsed)
+
+    def _run_frame(self):
+        """
+        Runs a single frame: input, updates, collisions and drawing.
+        """
+        self._check_events()
+        self._draw_frame(self._simulate())
+        if self.diagnostics:
+            self.diagnostics.update()
+
+    def _simulate(self):
+        """
+        Advances the game by one frame.
+
+        Returns:
+            FrameSnapshot: What to draw for the new frame.
+        """
+        self.background.update()
+
+        if self.game_active:
+            if self.bot:
+                self._apply_bot_action()
+            self.ship.update()
+            self.alien_fleet.update_fleet()
+            self._check_collisions()
+            self.particles.update()
+            self.HUD.update()
+
+        return self._take_snapshot()
+
+    def _take_snapshot(self):
+        """
+        Lists everything to draw, back to front, with positions copied.
+
+        Returns:
+            FrameSnapshot: The immutable frame to draw.
+        """
+        blits = self.background.blits()
+        blits.extend(self.ship.blits())
+        blits.extend(self.alien_fleet.blits())
+        blits.extend(self.particles.blits())
+        blits.extend(self.HUD.blits())
+        return FrameSnapshot(tuple(blits), self.game_active)
+
+    def _apply_bot_action(self):
+        """
+        Lets the bot read the game state and applies its action like keyboard input.
+        """
+        action = self.bot.act(read_state(self))
+        self.ship.moving_left = action.move < 0
+        self.ship.moving_right = action.move > 0
+        if action.fire:
+            self._fire_bullet()
                 
     def _check_collisions(self):
         """
@@ -77,21 +200,31 @@ class AlienInvasion:
         if self.ship.check_collisions(self.alien_fleet.fleet):
             self._check_game_status()
 
+        if self.ship.check_collisions(self.alien_fleet.arsenal.arsenal):
+            self._check_game_status()
+
         if self.alien_fleet.check_fleet_bottom():
             self._check_game_status()
 
         collisions = self.alien_fleet.check_collisions(self.ship.arsenal.arsenal)
         if collisions:
-            self.impact_sound.play()
-            self.impact_sound.fadeout(500)
+            self._play_impact()
+            for alien in collisions:
+                self.particles.burst(alien.rect.center)
             self.game_stats.update(collisions)
-            self.HUD.update_scores()
+            self.HUD.refresh_scores()
+            if self.analytics:
+                self.analytics.hit(len(collisions))
         
         if self.alien_fleet.check_destroyed_status():
-            self._reset_level()
             self.settings.increase_difficulty()
             self.game_stats.update_level()
+            self._reset_level()
             self.HUD.update_level()
+            if self.analytics:
+                self.analytics.level_up(self.game_stats.score)
+            if self.settings.checkpoints:
+                save_checkpoint(self)
             
 
 
@@ -99,12 +232,16 @@ class AlienInvasion:
         """
         Determines whether to end the game or reset after ship or alien reach eachother.
         """
+        if self.analytics:
+            self.analytics.death(self.game_stats.ships_left)
         if self.game_stats.ships_left > 0:
             self.game_stats.ships_left -= 1
             self._reset_level()
-            sleep(0.5)
+            sleep(self.settings.death_pause)
         else:
             self.game_active = False
+            if self.settings.checkpoints:
+                clear_checkpoint(self)
     
     def _reset_level(self):
         """
@@ -112,6 +249,10 @@ class AlienInvasion:
         """
         self.alien_fleet.fleet.empty()
         self.ship.arsenal.arsenal.empty()
+        self.alien_fleet.arsenal.empty()
+        self.particles.empty()
+        if self.gc_control:
+            self.gc_control.level_done()
         self.alien_fleet.create_fleet()
 
     def restart_game(self):
@@ -125,23 +266,25 @@ class AlienInvasion:
         
         self._reset_level()
         self.ship._center_ship()
+        if self.settings.checkpoints:
+            load_checkpoint(self)
         self.game_active = True
         pygame.mouse.set_visible(False)
 
-    def _update_screen(self):
+    def _draw_frame(self, snapshot: FrameSnapshot):
         """
-        Redraws all elements on the screen.
+        Draws a frame snapshot and shows it.
+
+        Args:
+            snapshot (FrameSnapshot): The frame to draw.
         """
-        self.screen.blit(self.bg, (0,0))
-        self.ship.draw()
-        self.alien_fleet.draw()
-        self.HUD.draw()
+        self.screen.blits(snapshot.blits, doreturn=False)
 
-        if not self.game_active:
+        if not snapshot.game_active:
             self.play_button.draw()
             pygame.mouse.set_visible(True)
 
-        pygame.display.flip()
+        self.display.present()
 
     def _check_events(self):
         """
@@ -149,22 +292,21 @@ class AlienInvasion:
         """
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                self.running = False
-                self.game_stats.save_scores()
-                pygame.quit()
-                sys.exit()
+                self._quit_game()
             elif event.type == pygame.KEYDOWN and self.game_active == True:
                 self._check_keydown_event(event)
             elif event.type == pygame.KEYUP:
                 self._check_keyup_event(event)
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 self._check_button_clicked()
+            elif event.type == pygame.VIDEORESIZE:
+                self.display.resize(event.size)
 
     def _check_button_clicked(self):
         """
         Starts a new game when the Play button is clicked.
         """
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.display.to_logical(pygame.mouse.get_pos())
         if self.play_button.check_clicked(mouse_pos):
             self.restart_game()
         
@@ -186,15 +328,47 @@ class AlienInvasion:
         elif event.key == pygame.K_LEFT:
             self.ship.moving_left = True
         elif event.key == pygame.K_SPACE:
-            if self.ship.fire():
-                self.laser_sound.play()
-                self.laser_sound.fadeout(250)
+            self._fire_bullet()
         elif event.key == pygame.K_q:
-            self.running = False
-            self.game_stats.save_scores()
-            pygame.quit()
-            sys.exit()
+            self._quit_game()
+
+    def _play_impact(self):
+        """
+        Plays the impact sound, skipping hits within sound_cooldown ms of the last one.
+        """
+        now = pygame.time.get_ticks()
+        if now - self.last_impact < self.sound_cooldown:
+            return
+        self.last_impact = now
+        self.impact_sound.play()
+        self.impact_sound.fadeout(500)
+
+    def _quit_game(self):
+        """
+        Saves the scores and closes the game.
+        """
+        self.running = False
+        self.game_stats.save_scores()
+        if self.game_active and self.settings.checkpoints:
+            save_checkpoint(self)
+        if self.diagnostics:
+            self.diagnostics.close()
+        if self.analytics:
+            self.analytics.close()
+        pygame.quit()
+        sys.exit()
+
+    def _fire_bullet(self):
+        """
+        Fires a bullet from the ship and plays the laser sound.
+        """
+        if self.ship.fire():
+            self.laser_sound.play()
+            self.laser_sound.fadeout(250)
+            if self.analytics:
+                self.analytics.shot(len(self.ship.arsenal.arsenal))
 
 if __name__ == '__main__':
     ai = AlienInvasion()
+    ai.startup_report = '--startup-report' in sys.argv
     ai.run_game()
\ No newline at end of file
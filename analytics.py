@@ -0,0 +1,142 @@
+"""
+Analytics module for Alien Invasion.
+
+Records gameplay events into a fixed-size in-memory buffer and writes them
+in batches to a gzip-compressed newline-delimited JSON file from a background
+thread, so the frame loop never waits on disk. When the buffer is full new
+events are dropped and counted instead of blocking.
+"""
+import gzip
+import json
+import threading
+from collections import deque
+from time import time
+from typing import NamedTuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+SHOT = 'shot'
+HIT = 'hit'
+DEATH = 'death'
+LEVEL_UP = 'level_up'
+
+
+class Event(NamedTuple):
+    """A single gameplay event."""
+    time: float
+    kind: str
+    level: int
+    value: int
+
+
+class EventBus:
+    """
+    Buffers events and writes them to disk from a background thread.
+    """
+    def __init__(self, game: 'AlienInvasion'):
+        """
+        Initializes the buffer and starts the writer thread.
+
+        Args:
+            game (AlienInvasion): Main game.
+        """
+        self.game = game
+        self.settings = game.settings
+        self.capacity = self.settings.analytics_buffer
+        self.buffer = deque()
+        self.dropped = 0
+        self.dropped_written = 0
+        self.wake = threading.Event()
+        self.stopping = False
+        self.writer = threading.Thread(target=self._write_loop, name='analytics', daemon=True)
+        self.writer.start()
+
+    def record(self, kind, value=0):
+        """
+        Records an event, dropping it if the buffer is full.
+
+        Args:
+            kind (str): SHOT, HIT, DEATH or LEVEL_UP.
+            value (int): Detail for the event, such as the number of aliens hit.
+        """
+        if len(self.buffer) >= self.capacity:
+            self.dropped += 1
+            return
+        self.buffer.append(Event(time(), kind, self.game.game_stats.level, value))
+        if len(self.buffer) >= self.settings.analytics_batch:
+            self.wake.set()
+
+    def shot(self, bullets):
+        """
+        Records the ship firing.
+
+        Args:
+            bullets (int): Ship bullets on screen after the shot.
+        """
+        self.record(SHOT, bullets)
+
+    def hit(self, aliens):
+        """
+        Records aliens being shot down.
+
+        Args:
+            aliens (int): Number of aliens hit this frame.
+        """
+        self.record(HIT, aliens)
+
+    def death(self, ships_left):
+        """
+        Records the ship being lost.
+
+        Args:
+            ships_left (int): Ships left before this one was lost.
+        """
+        self.record(DEATH, ships_left)
+
+    def level_up(self, score):
+        """
+        Records a level being cleared.
+
+        Args:
+            score (int): Score when the level was cleared.
+        """
+        self.record(LEVEL_UP, score)
+
+    def _write_loop(self):
+        """
+        Writes batches until the bus is closed.
+        """
+        while not self.stopping:
+            self.wake.wait(self.settings.analytics_interval)
+            self.wake.clear()
+            self._flush()
+        self._flush()
+
+    def _flush(self):
+        """
+        Writes every buffered event as one compressed batch.
+        """
+        lines = []
+        while self.buffer:
+            lines.append(json.dumps(self.buffer.popleft()._asdict()))
+        dropped = self.dropped
+        if dropped > self.dropped_written:
+            lines.append(json.dumps(
+                {'time': time(), 'kind': 'dropped', 'value': dropped - self.dropped_written}))
+            self.dropped_written = dropped
+        if not lines:
+            return
+        try:
+            with gzip.open(self.settings.analytics_file, 'at', encoding='utf-8') as file:
+                file.write('\n'.join(lines) + '\n')
+        except OSError as e:
+            print(f'Could not write analytics: {e}')
+
+    def close(self):
+        """
+        Stops the writer thread after it writes what is left.
+        """
+        self.stopping = True
+        self.wake.set()
+        self.writer.join()
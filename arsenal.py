@@ -38,17 +38,19 @@ class Arsenal:
         """
         Remove bullets that have gone off screen.
         """
-        for bullet in self.arsenal.copy():
+        for bullet in self.arsenal.sprites():
             if bullet.rect.bottom <= 0:
                 self.arsenal.remove(bullet)
 
-    def draw(self):
+    def blits(self):
         """
-        Draws all bullets.
+        Lists what to draw for all bullets.
+
+        Returns:
+            list: (image, position) pairs.
         """
-        for bullet in self.arsenal:
-            bullet.draw_bullet()
-    
+        return [(bullet.image, bullet.rect.topleft) for bullet in self.arsenal]
+
     def fire_bullet(self):
         """
         Fires a bullet.
@@ -0,0 +1,121 @@
+"""
+Background module for Alien Invasion.
+
+Scrolling parallax background made of tiled layers. Each layer is a
+pre-converted tile repeated over the screen; only the tiles that are in view
+are blitted each frame.
+"""
+import pygame
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+
+class ParallaxLayer:
+    """
+    A single layer of repeating tiles scrolling down the screen.
+    """
+    def __init__(self, game: 'AlienInvasion', file, size, period, speed, alpha, mirrored):
+        """
+        Initializes the layer and its tile.
+
+        Args:
+            game (AlienInvasion): Main game.
+            file (Path): Tile image.
+            size (tuple): Tile width and height.
+            period (tuple): Horizontal and vertical distance between tiles.
+            speed (float): Pixels scrolled per frame, may be less than one.
+            alpha (bool): Whether the tile has transparency.
+            mirrored (bool): Stack the tile on a flipped copy so it repeats without a seam.
+        """
+        self.boundaries = game.screen.get_rect()
+        self.tile = game.display.images.get(file, size, alpha=alpha)
+        self.tile_w, self.tile_h = size
+        if mirrored:
+            self._mirror_tile()
+        self.period_w, self.period_h = period
+        self.speed = speed
+        self.offset = 0.0
+        self.rows_scrolled = 0
+
+    def _mirror_tile(self):
+        """
+        Builds a tile twice as tall with a vertically flipped copy underneath.
+        """
+        tile = pygame.Surface((self.tile_w, self.tile_h * 2), self.tile.get_flags(), self.tile)
+        tile.blit(self.tile, (0, 0))
+        tile.blit(pygame.transform.flip(self.tile, False, True), (0, self.tile_h))
+        self.tile = tile
+        self.tile_h *= 2
+
+    def update(self):
+        """
+        Scrolls the layer, keeping the fractional part of the offset.
+        """
+        self.offset += self.speed
+        if self.offset >= self.period_h:
+            wraps = int(self.offset // self.period_h)
+            self.offset -= wraps * self.period_h
+            self.rows_scrolled += wraps
+
+    def blits(self):
+        """
+        Lists the tiles that overlap the screen.
+
+        Returns:
+            list: (image, position) pairs.
+        """
+        screen_w = self.boundaries.width
+        screen_h = self.boundaries.height
+        tile = self.tile
+        tiles = []
+        row = self.rows_scrolled
+        y = round(self.offset)
+        while y - self.period_h + self.tile_h > 0:
+            y -= self.period_h
+            row += 1
+        while y < screen_h:
+            x = (row * self.tile_w) % self.period_w - self.period_w
+            while x < screen_w:
+                if x + self.tile_w > 0:
+                    tiles.append((tile, (x, y)))
+                x += self.period_w
+            y += self.period_h
+            row -= 1
+        return tiles
+
+
+class Background:
+    """
+    Manages all the parallax layers, back to front.
+    """
+    def __init__(self, game: 'AlienInvasion'):
+        """
+        Initializes the background layers from the settings.
+
+        Args:
+            game (AlienInvasion): Main game.
+        """
+        self.settings = game.settings
+        self.layers = [ParallaxLayer(game, *layer) for layer in self.settings.bg_layers]
+        self.layer_count = len(self.layers)
+
+    def update(self):
+        """
+        Scrolls every shown layer.
+        """
+        for layer in self.layers[:self.layer_count]:
+            layer.update()
+
+    def blits(self):
+        """
+        Lists the tiles of every shown layer, back to front.
+
+        Returns:
+            list: (image, position) pairs.
+        """
+        blits = []
+        for layer in self.layers[:self.layer_count]:
+            blits.extend(layer.blits())
+        return blits
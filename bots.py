@@ -0,0 +1,150 @@
+"""
+Bots module for Alien Invasion.
+
+Scripted players for automated testing. Each tick a bot is given a snapshot
+of the game state and returns an action, which the game applies the same way
+as keyboard input.
+"""
+import random
+from typing import NamedTuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pygame
+    from alien_invasion import AlienInvasion
+
+
+class BotState(NamedTuple):
+    """Snapshot of the game state a bot can see."""
+    ship_rect: 'pygame.Rect'
+    alien_rects: list
+    bullet_rects: list
+    enemy_bullet_rects: list
+    fleet_direction: int
+    fleet_speed: float
+    bullet_speed: float
+    bullets_left: int
+
+
+class BotAction(NamedTuple):
+    """What a bot wants to do this tick."""
+    move: int = 0
+    fire: bool = False
+
+
+def read_state(game: 'AlienInvasion'):
+    """
+    Builds a snapshot of the game state for a bot.
+
+    Args:
+        game (AlienInvasion): Main game.
+
+    Returns:
+        BotState: Copies of the positions the bot may use.
+    """
+    settings = game.settings
+    arsenal = game.ship.arsenal.arsenal
+    return BotState(
+        ship_rect=game.ship.rect.copy(),
+        alien_rects=[alien.rect.copy() for alien in game.alien_fleet.fleet],
+        bullet_rects=[bullet.rect.copy() for bullet in arsenal],
+        enemy_bullet_rects=[bullet.rect.copy() for bullet in game.alien_fleet.arsenal.arsenal],
+        fleet_direction=game.alien_fleet.fleet_direction,
+        fleet_speed=settings.fleet_speed,
+        bullet_speed=settings.bullet_speed,
+        bullets_left=settings.bullet_amount - len(arsenal),
+    )
+
+
+class Bot:
+    """
+    Base class for bots.
+    """
+    name = 'bot'
+
+    def act(self, state: BotState):
+        """
+        Decides what to do this tick.
+
+        Args:
+            state (BotState): Current game state.
+
+        Returns:
+            BotAction: The action to apply.
+        """
+        raise NotImplementedError
+
+    def _move_towards(self, state: BotState, target_x):
+        """
+        Returns the direction that moves the ship towards target_x.
+
+        Args:
+            state (BotState): Current game state.
+            target_x (float): Horizontal position to reach.
+
+        Returns:
+            int: -1, 0 or 1.
+        """
+        center_x = state.ship_rect.centerx
+        if target_x < center_x - 2:
+            return -1
+        if target_x > center_x + 2:
+            return 1
+        return 0
+
+
+class RandomBot(Bot):
+    """
+    Moves and fires at random.
+    """
+    name = 'random'
+
+    def __init__(self, seed=None):
+        """
+        Initializes the bot.
+
+        Args:
+            seed (int): Seed for repeatable runs.
+        """
+        self.rng = random.Random(seed)
+        self.move = 0
+
+    def act(self, state: BotState):
+        if self.rng.random() < 0.05:
+            self.move = self.rng.choice((-1, 0, 1))
+        return BotAction(self.move, self.rng.random() < 0.2)
+
+
+class GreedyBot(Bot):
+    """
+    Moves under the nearest column of aliens and fires when lined up.
+    """
+    name = 'greedy'
+
+    def act(self, state: BotState):
+        if not state.alien_rects:
+            return BotAction()
+        ship_x = state.ship_rect.centerx
+        target = min(state.alien_rects, key=lambda rect: abs(rect.centerx - ship_x))
+        move = self._move_towards(state, target.centerx)
+        lined_up = abs(target.centerx - ship_x) < target.width // 2
+        return BotAction(move, lined_up and state.bullets_left > 0)
+
+
+class AimAheadBot(Bot):
+    """
+    Leads the lowest alien, aiming where it will be when a bullet arrives.
+    """
+    name = 'aim'
+
+    def act(self, state: BotState):
+        if not state.alien_rects:
+            return BotAction()
+        target = max(state.alien_rects, key=lambda rect: rect.bottom)
+        frames = (state.ship_rect.top - target.bottom) / max(state.bullet_speed, 1)
+        lead_x = target.centerx + state.fleet_direction * state.fleet_speed * frames
+        move = self._move_towards(state, lead_x)
+        lined_up = abs(lead_x - state.ship_rect.centerx) < target.width // 2
+        return BotAction(move, lined_up and state.bullets_left > 0)
+
+
+BOTS = {bot.name: bot for bot in (RandomBot, GreedyBot, AimAheadBot)}
@@ -24,25 +24,29 @@ class Bullet(Sprite):
         self.screen = game.screen
         self.settings = game.settings
 
-        self.image = pygame.image.load(self.settings.bullet_file)
-        self.image = pygame.transform.scale(self.image, 
+        self.image = game.display.images.get(self.settings.bullet_file,
             (self.settings.bullet_w, self.settings.bullet_h)
             )
         
         self.rect = self.image.get_rect()
         self.rect.midtop = game.ship.rect.midtop
         self.y = float(self.rect.y)
+        self.travel = 0
     
     def update(self):
         """
         Moves the bullets on the screen.
         """
+        previous_y = self.rect.y
         self.y -= self.settings.bullet_speed
         self.rect.y = self.y
+        self.travel = previous_y - self.rect.y
 
-    def draw_bullet(self):
+    def swept_rect(self):
         """
-        Draws the bullets on the screen.
-        """
-        self.screen.blit(self.image, self.rect)
+        Gets the area the bullet covered during its last move.
 
+        Returns:
+            pygame.Rect: The bullet stretched down to where it started.
+        """
+        return pygame.Rect(self.rect.x, self.rect.y, self.rect.width, self.rect.height + self.travel)
@@ -0,0 +1,173 @@
+"""
+Diagnostics module for Alien Invasion.
+
+Opt-in memory and allocation tracking for long running sessions. Samples live
+object counts, heap size and garbage collection pauses, writes them to a log
+as JSON lines and flags anything that keeps growing.
+"""
+import gc
+import json
+import tracemalloc
+from collections import Counter, deque
+from time import perf_counter
+import pygame
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+
+class MemoryTracker:
+    """
+    Samples memory use and GC pauses while the game runs.
+    """
+    def __init__(self, game: 'AlienInvasion'):
+        """
+        Starts tracemalloc and hooks into the garbage collector.
+
+        Args:
+            game (AlienInvasion): Main game.
+        """
+        self.game = game
+        self.settings = game.settings
+        self.path = self.settings.diagnostics_file
+        self.classes = set(self.settings.diagnostics_classes)
+        self.history = {}
+        self.samples = 0
+        self.gc_pauses = []
+        self._gc_start = 0.0
+        self.level = game.game_stats.level
+        self.level_heap = 0
+        self.next_sample = perf_counter() + self.settings.diagnostics_interval
+
+        tracemalloc.start()
+        gc.callbacks.append(self._on_gc)
+        self.log = open(self.path, 'a', encoding='utf-8')
+
+    def _on_gc(self, phase, info):
+        """
+        Times each garbage collection.
+
+        Args:
+            phase (str): 'start' or 'stop'.
+            info (dict): Details from the garbage collector.
+        """
+        if phase == 'start':
+            self._gc_start = perf_counter()
+        else:
+            self.gc_pauses.append(
+                (info['generation'], (perf_counter() - self._gc_start) * 1000))
+
+    def update(self):
+        """
+        Takes a sample when the interval has passed or the level changed.
+        """
+        level = self.game.game_stats.level
+        if level != self.level:
+            self.sample('level')
+            self.level = level
+        elif perf_counter() >= self.next_sample:
+            self.sample('interval')
+
+    def _count_objects(self):
+        """
+        Counts live objects of the tracked classes reachable from the game.
+
+        Walks the attributes of the game's components, their sprite groups and
+        containers, instead of the whole heap, so a sample stays short.
+
+        Returns:
+            Counter: Number of live objects per class name.
+        """
+        counts = Counter()
+        seen = set()
+        stack = [self.game]
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            name = type(obj).__name__
+            if name in self.classes:
+                counts[name] += 1
+            if isinstance(obj, pygame.Surface):
+                continue
+            if isinstance(obj, pygame.sprite.AbstractGroup):
+                stack.extend(obj.sprites())
+            elif isinstance(obj, (list, tuple, set, deque)):
+                stack.extend(obj)
+            elif isinstance(obj, dict):
+                stack.extend(obj.values())
+            elif hasattr(obj, '__dict__'):
+                stack.extend(vars(obj).values())
+        return counts
+
+    def sample(self, reason):
+        """
+        Records a snapshot and writes it to the log.
+
+        Args:
+            reason (str): Why the sample was taken.
+        """
+        start = perf_counter()
+        self.next_sample = start + self.settings.diagnostics_interval
+        self.samples += 1
+        heap, peak = tracemalloc.get_traced_memory()
+        counts = self._count_objects()
+        pauses = self.gc_pauses
+        self.gc_pauses = []
+
+        record = {
+            'time': round(perf_counter(), 3),
+            'reason': reason,
+            'level': self.level,
+            'heap': heap,
+            'peak': peak,
+            'level_growth': heap - self.level_heap,
+            'objects': dict(counts),
+            'gc_count': len(pauses),
+            'gc_max_ms': round(max((ms for _, ms in pauses), default=0), 3),
+            'gc_total_ms': round(sum(ms for _, ms in pauses), 3),
+        }
+        if reason == 'level':
+            self.level_heap = heap
+
+        metrics = dict(counts, heap=heap)
+        growing = [name for name, value in metrics.items() if self._keeps_growing(name, value)]
+        if growing:
+            record['growing'] = growing
+            print(f'Diagnostics: possible unbounded growth in {", ".join(growing)}')
+
+        record['sample_ms'] = round((perf_counter() - start) * 1000, 3)
+        self.log.write(json.dumps(record) + '\n')
+        self.log.flush()
+
+    def _keeps_growing(self, name, value):
+        """
+        Checks whether a metric grew in every one of the last samples,
+        and by more than diagnostics_growth overall.
+
+        Args:
+            name (str): Name of the metric.
+            value (int): Latest value.
+
+        Returns:
+            bool: True if the metric keeps growing.
+        """
+        window = self.history.setdefault(
+            name, deque(maxlen=self.settings.diagnostics_window))
+        window.append(value)
+        if len(window) < window.maxlen:
+            return False
+        values = list(window)
+        return (all(before < after for before, after in zip(values, values[1:]))
+                and values[-1] > values[0] * (1 + self.settings.diagnostics_growth))
+
+    def close(self):
+        """
+        Takes a final sample and stops tracking.
+        """
+        self.sample('close')
+        gc.callbacks.remove(self._on_gc)
+        tracemalloc.stop()
+        self.log.close()
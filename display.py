@@ -0,0 +1,111 @@
+"""
+Display module for Alien Invasion.
+
+The game always draws at the logical resolution from Settings. The display
+either lets SDL upscale it in hardware (pygame.SCALED) or scales the finished
+frame once into a resizable window. Images are loaded, converted and scaled
+once through a shared cache instead of by every sprite.
+"""
+import pygame
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+
+class ImageCache:
+    """
+    Caches converted and pre-scaled images, keyed by file, size and transparency.
+    """
+    def __init__(self):
+        """
+        Initializes an empty cache.
+        """
+        self.images = {}
+
+    def get(self, path, size, alpha=True):
+        """
+        Returns an image scaled to size, loading it the first time it is asked for.
+
+        Args:
+            path (Path): Image file.
+            size (tuple): Width and height in logical pixels.
+            alpha (bool): Keep per-pixel transparency. Opaque images blit faster without it.
+
+        Returns:
+            pygame.Surface: The shared scaled image.
+        """
+        key = (path, size, alpha)
+        image = self.images.get(key)
+        if image is None:
+            image = pygame.image.load(path)
+            image = image.convert_alpha() if alpha else image.convert()
+            image = pygame.transform.smoothscale(image, size)
+            self.images[key] = image
+        return image
+
+
+class Display:
+    """
+    Manages the window and the logical screen the game draws to.
+    """
+    def __init__(self, game: 'AlienInvasion'):
+        """
+        Opens the window and creates the logical screen.
+
+        Args:
+            game (AlienInvasion): Main game.
+        """
+        self.game = game
+        self.settings = game.settings
+        self.logical_size = (self.settings.screen_w, self.settings.screen_h)
+
+        if self.settings.display_scaled:
+            self.window = pygame.display.set_mode(
+                self.logical_size, pygame.SCALED | pygame.RESIZABLE
+                )
+            self.screen = self.window
+        else:
+            self.window = pygame.display.set_mode(
+                (self.settings.window_w, self.settings.window_h), pygame.RESIZABLE
+                )
+            self.screen = pygame.Surface(self.logical_size).convert()
+        pygame.display.set_caption(self.settings.name)
+
+        self.images = ImageCache()
+
+    def resize(self, size):
+        """
+        Handles the window being resized.
+
+        Only the window changes size; the logical screen and cached images stay the same.
+
+        Args:
+            size (tuple): New window size.
+        """
+        if not self.settings.display_scaled:
+            self.window = pygame.display.set_mode(size, pygame.RESIZABLE)
+
+    def to_logical(self, pos):
+        """
+        Converts a window position into a logical screen position.
+
+        Args:
+            pos (tuple): Position in the window.
+
+        Returns:
+            tuple: Position on the logical screen.
+        """
+        if self.screen is self.window:
+            return pos
+        window_w, window_h = self.window.get_size()
+        return (pos[0] * self.logical_size[0] // window_w,
+                pos[1] * self.logical_size[1] // window_h)
+
+    def present(self):
+        """
+        Shows the finished frame, upscaling it once if SDL is not doing it.
+        """
+        if self.screen is not self.window:
+            pygame.transform.scale(self.screen, self.window.get_size(), self.window)
+        pygame.display.flip()
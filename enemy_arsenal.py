@@ -0,0 +1,85 @@
+"""
+Enemy Arsenal module for Alien Invasion.
+
+This class manages the alien fleet's ammo using a preallocated pool of bullets.
+"""
+
+import pygame
+from enemy_bullet import EnemyBullet
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+
+class EnemyArsenal:
+    """
+    A class to manage the enemy arsenal.
+    """
+    def __init__(self, game: 'AlienInvasion'):
+        """
+        Initializes the enemy arsenal and fills the bullet pool.
+
+        Args:
+            game (AlienInvasion): Main game.
+        """
+        self.game = game
+        self.settings = game.settings
+        self.screen_h = self.settings.screen_h
+        self.arsenal = pygame.sprite.Group()
+
+        image = game.display.images.get(self.settings.enemy_bullet_file,
+            (self.settings.enemy_bullet_w, self.settings.enemy_bullet_h)
+            )
+        image = pygame.transform.flip(image, False, True)
+        self.pool = [EnemyBullet(game, image)
+                     for _ in range(self.settings.enemy_bullet_amount)]
+
+    def update_arsenal(self):
+        """
+        Updates all enemy bullets in the arsenal.
+        """
+        self.arsenal.update()
+        self._remove_bullets_offscreen()
+
+    def _remove_bullets_offscreen(self):
+        """
+        Return bullets that have gone off screen to the pool.
+        """
+        for bullet in self.arsenal.sprites():
+            if bullet.rect.top >= self.screen_h:
+                self.arsenal.remove(bullet)
+                self.pool.append(bullet)
+
+    def empty(self):
+        """
+        Return every active bullet to the pool.
+        """
+        self.pool.extend(self.arsenal.sprites())
+        self.arsenal.empty()
+
+    def blits(self):
+        """
+        Lists what to draw for all enemy bullets.
+
+        Returns:
+            list: (image, position) pairs.
+        """
+        return [(bullet.image, bullet.rect.topleft) for bullet in self.arsenal]
+
+    def fire_bullet(self, midbottom):
+        """
+        Fires a bullet from the pool.
+
+        Args:
+            midbottom (tuple): Bottom center of the alien firing.
+
+        Returns:
+            bool: True or false if a bullet was fired.
+        """
+        if not self.pool:
+            return False
+        bullet = self.pool.pop()
+        bullet.fire(midbottom)
+        self.arsenal.add(bullet)
+        return True
@@ -0,0 +1,50 @@
+"""
+Enemy Bullet module for Alien Invasion.
+
+This module is responsible for the bullets fired by the alien fleet.
+"""
+import pygame
+from pygame.sprite import Sprite
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+class EnemyBullet(Sprite):
+    """
+    Class for an enemy bullet.
+
+    Enemy bullets are pooled and reused, so the image is shared and
+    the bullet is positioned by fire instead of on creation.
+
+    Args:
+        game (AlienInvasion): Main game.
+        image (pygame.Surface): Shared bullet image.
+    """
+    def __init__(self, game: 'AlienInvasion', image: pygame.Surface):
+        super().__init__()
+
+        self.screen = game.screen
+        self.settings = game.settings
+
+        self.image = image
+        self.rect = self.image.get_rect()
+        self.y = 0.0
+
+    def fire(self, midbottom):
+        """
+        Places the bullet under the alien that fired it.
+
+        Args:
+            midbottom (tuple): Bottom center of the alien.
+        """
+        self.rect.midtop = midbottom
+        self.y = float(self.rect.y)
+
+    def update(self):
+        """
+        Moves the bullet down the screen.
+        """
+        self.y += self.settings.enemy_bullet_speed
+        self.rect.y = self.y
@@ -0,0 +1,133 @@
+"""
+Formations module for Alien Invasion.
+
+Fleet formations are generators that lazily yield the grid cells (col, row)
+an alien should occupy, so a formation of any size can be streamed into the
+fleet a few aliens at a time.
+"""
+import random
+
+FORMATIONS = {}
+
+
+def formation(name):
+    """
+    Register a formation generator under a name.
+
+    Args:
+        name (str): Name used in Settings.fleet_formations.
+
+    Returns:
+        function: Decorator that registers the generator.
+    """
+    def register(func):
+        FORMATIONS[name] = func
+        return func
+    return register
+
+
+def get_formation(name):
+    """
+    Look up a registered formation.
+
+    Args:
+        name (str): Name of the formation.
+
+    Returns:
+        function: The formation generator.
+    """
+    try:
+        return FORMATIONS[name]
+    except KeyError:
+        raise ValueError(f'Unknown formation: {name}') from None
+
+
+@formation('cross')
+def cross(fleet_w, fleet_h, level):
+    """
+    Yield cells in a cross pattern.
+
+    Args:
+        fleet_w (int): Number of aliens width.
+        fleet_h (int): Number of aliens height.
+        level (int): Current level.
+    """
+    center_col = fleet_w // 2
+    center_row = fleet_h // 2
+    for row in range(fleet_h):
+        for col in range(fleet_w):
+            if row == center_row or col == center_col:
+                yield col, row
+
+
+@formation('rectangle')
+def rectangle(fleet_w, fleet_h, level):
+    """
+    Yield cells in a spaced out rectangle.
+
+    Args:
+        fleet_w (int): Number of aliens width.
+        fleet_h (int): Number of aliens height.
+        level (int): Current level.
+    """
+    for row in range(1, fleet_h, 2):
+        for col in range(1, fleet_w, 2):
+            yield col, row
+
+
+@formation('diamond')
+def diamond(fleet_w, fleet_h, level):
+    """
+    Yield cells in a diamond outline.
+
+    Args:
+        fleet_w (int): Number of aliens width.
+        fleet_h (int): Number of aliens height.
+        level (int): Current level.
+    """
+    center_col = fleet_w // 2
+    center_row = fleet_h // 2
+    radius = min(center_col, center_row)
+    for row in range(fleet_h):
+        for col in range(fleet_w):
+            if abs(col - center_col) + abs(row - center_row) == radius:
+                yield col, row
+
+
+@formation('block')
+def block(fleet_w, fleet_h, level):
+    """
+    Yield every cell of the grid.
+
+    Args:
+        fleet_w (int): Number of aliens width.
+        fleet_h (int): Number of aliens height.
+        level (int): Current level.
+    """
+    for row in range(fleet_h):
+        for col in range(fleet_w):
+            yield col, row
+
+
+@formation('procedural')
+def procedural(fleet_w, fleet_h, level):
+    """
+    Yield a random, mirrored formation that gets denser with each level.
+
+    The level is used as the seed so the same level always gets the same layout.
+
+    Args:
+        fleet_w (int): Number of aliens width.
+        fleet_h (int): Number of aliens height.
+        level (int): Current level.
+    """
+    rng = random.Random(level)
+    density = min(0.3 + 0.05 * level, 0.9)
+    half_w = (fleet_w + 1) // 2
+    for row in range(fleet_h):
+        for col in range(half_w):
+            if rng.random() < density:
+                yield col, row
+                mirror = fleet_w - 1 - col
+                if mirror != col:
+                    yield mirror, row
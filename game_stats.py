@@ -31,7 +31,7 @@ class GameStats():
         Load saved high score from file, or initialize and save if none already existed.
         """
         self.path = self.settings.scores_file
-        if self.path.exists() and self.path.stat.__sizeof__() > 20:
+        if self.path.exists() and self.path.stat().st_size > 0:
             contents = self.path.read_text()  
             scores = json.loads(contents)
             self.hi_score = scores.get('hi_score', 0)
@@ -0,0 +1,87 @@
+"""
+GC Control module for Alien Invasion.
+
+Keeps Python's garbage collector from pausing in the middle of a frame.
+Objects created at startup are frozen, automatic collection is turned off,
+and collections are run only at safe points: between levels, on the Play
+screen, or at the end of a frame that has time to spare.
+"""
+import gc
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+
+class GCController:
+    """
+    Runs garbage collection only when it will not cause a hitch.
+    """
+    def __init__(self, game: 'AlienInvasion'):
+        """
+        Collects once, freezes everything created so far and disables automatic collection.
+
+        Args:
+            game (AlienInvasion): Main game.
+        """
+        self.game = game
+        self.settings = game.settings
+        self.frame_budget = 1 / self.settings.FPS
+        self.threshold = gc.get_threshold()[0]
+        self.pauses = []
+
+        gc.collect()
+        gc.freeze()
+        gc.disable()
+
+    def collect(self, generation, reason):
+        """
+        Runs a collection and records how long it took.
+
+        Args:
+            generation (int): Oldest generation to collect.
+            reason (str): Which idle window the collection ran in.
+        """
+        start = perf_counter()
+        gc.collect(generation)
+        self.pauses.append((reason, generation, (perf_counter() - start) * 1000))
+        del self.pauses[:-self.settings.gc_pause_history]
+
+    def frame_done(self, elapsed):
+        """
+        Collects at the end of a frame if it is safe and needed.
+
+        Args:
+            elapsed (float): Seconds the frame took before waiting for the clock.
+        """
+        pending = gc.get_count()[0]
+        if pending < self.threshold:
+            return
+        if not self.game.game_active:
+            self.collect(2, 'menu')
+        elif (self.frame_budget - elapsed) * 1000 >= self.settings.gc_slack_ms:
+            self.collect(1, 'slack')
+        elif pending >= self.threshold * self.settings.gc_force_factor:
+            self.collect(0, 'forced')
+
+    def level_done(self):
+        """
+        Runs a full collection between levels.
+        """
+        self.collect(2, 'level')
+
+    def summary(self):
+        """
+        Summarizes the recorded collection pauses.
+
+        Returns:
+            str: Count, total and longest pause per idle window.
+        """
+        lines = []
+        for reason in ('level', 'menu', 'slack', 'forced'):
+            times = [ms for name, _, ms in self.pauses if name == reason]
+            if times:
+                lines.append(f'gc {reason}: {len(times)} collections, '
+                             f'{sum(times):.2f} ms total, {max(times):.2f} ms max')
+        return '\n'.join(lines)
@@ -0,0 +1,80 @@
+"""
+Governor module for Alien Invasion.
+
+Adaptive quality governor. Watches how long frames take and steps optional
+work (particles, background layers, HUD refresh and impact sounds) down when
+frames run over budget, and back up when there is headroom.
+"""
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+
+class QualityGovernor:
+    """
+    Picks a quality level from Settings.quality_levels based on frame times.
+    """
+    def __init__(self, game: 'AlienInvasion'):
+        """
+        Initializes the governor at the highest quality level.
+
+        Args:
+            game (AlienInvasion): Main game.
+        """
+        self.game = game
+        self.settings = game.settings
+        self.budget = 1 / self.settings.FPS
+        self.average = 0.0
+        self.frames_over = 0
+        self.frames_under = 0
+        self.level = len(self.settings.quality_levels) - 1
+        self._apply()
+
+    def frame_done(self, elapsed):
+        """
+        Updates the average frame time and changes level if needed.
+
+        Args:
+            elapsed (float): Seconds the frame took before waiting for the clock.
+        """
+        self.average += (elapsed - self.average) * self.settings.quality_smoothing
+        if self.average > self.budget * self.settings.quality_down_ratio:
+            self.frames_over += 1
+            self.frames_under = 0
+        elif self.average < self.budget * self.settings.quality_up_ratio:
+            self.frames_under += 1
+            self.frames_over = 0
+        else:
+            self.frames_over = 0
+            self.frames_under = 0
+
+        if self.frames_over >= self.settings.quality_down_frames and self.level > 0:
+            self.set_level(self.level - 1)
+        elif (self.frames_under >= self.settings.quality_up_frames
+              and self.level < len(self.settings.quality_levels) - 1):
+            self.set_level(self.level + 1)
+
+    def set_level(self, level):
+        """
+        Switches to a quality level.
+
+        Args:
+            level (int): Index into Settings.quality_levels, 0 is the lowest.
+        """
+        self.level = level
+        self.frames_over = 0
+        self.frames_under = 0
+        self._apply()
+
+    def _apply(self):
+        """
+        Applies the current quality level to the game.
+        """
+        (particle_scale, layer_count, hud_interval,
+         sound_cooldown) = self.settings.quality_levels[self.level]
+        game = self.game
+        game.particles.burst_size = int(self.settings.particle_burst * particle_scale)
+        game.background.layer_count = min(layer_count, len(game.background.layers))
+        game.HUD.refresh_interval = hud_interval
+        game.sound_cooldown = sound_cooldown
@@ -24,6 +24,9 @@ class HUD():
         self.font = pygame.font.Font(self.settings.font_file, 
             self.settings.HUD_font_size)
         self.padding = 20
+        self.refresh_interval = 1
+        self.frames_since_refresh = 0
+        self.scores_changed = False
         self.update_scores()
         self._setup_life_image()
         self.update_level()
@@ -34,16 +37,31 @@ class HUD():
         """
         Loads and scalse the life image and displays remaining lives.
         """
-        self.life_image = pygame.image.load(self.settings.ship_file)
-        self.life_image = pygame.transform.scale(self.life_image, 
-            (self.settings.ship_file_w, self.settings.ship_file_h
-            ))
+        self.life_image = self.game.display.images.get(self.settings.ship_file,
+            (self.settings.ship_file_w, self.settings.ship_file_h)
+            )
         self.life_rect = self.life_image.get_rect()
 
+    def refresh_scores(self):
+        """
+        Marks the scores as changed so update re-renders them.
+        """
+        self.scores_changed = True
+
+    def update(self):
+        """
+        Re-renders changed scores, at most once every refresh_interval frames.
+        """
+        self.frames_since_refresh += 1
+        if self.scores_changed and self.frames_since_refresh >= self.refresh_interval:
+            self.update_scores()
+
     def update_scores(self):
         """
         Updates all scores related to HUD.
         """
+        self.scores_changed = False
+        self.frames_since_refresh = 0
         self._update_score()
         self._update_hi_score()
         self._update_max_score()
@@ -91,24 +109,33 @@ class HUD():
         self.level_rect.left = self.padding
         self.level_rect.top = self.life_rect.bottom + self.padding
     
-    def _draw_lives(self):
+    def _lives_blits(self):
         """
-        Draws ship icons for remaining lives in the top-left corner.
+        Lists ship icons for remaining lives in the top-left corner.
+
+        Returns:
+            list: (image, position) pairs.
         """
+        blits = []
         current_x = self.padding
         current_y = self.padding
         for _ in range(self.game_stats.ships_left):
-            self.screen.blit(self.life_image, (current_x, current_y))
+            blits.append((self.life_image, (current_x, current_y)))
             current_x += self.life_rect.width + self.padding
-    
-    def draw(self):
-        """
-        Draws the HUD.
+        return blits
+
+    def blits(self):
         """
-        self.screen.blit(self.hi_score_image, self.hi_score_rect)
-        self.screen.blit(self.max_score_image, self.max_score_rect)
-        self.screen.blit(self.score_image, self.score_rect)
-        self.screen.blit(self.level_image, self.level_rect)
-        self._draw_lives()
-    
-    
+        Lists what to draw for the HUD.
+
+        Returns:
+            list: (image, position) pairs.
+        """
+        blits = [
+            (self.hi_score_image, self.hi_score_rect.topleft),
+            (self.max_score_image, self.max_score_rect.topleft),
+            (self.score_image, self.score_rect.topleft),
+            (self.level_image, self.level_rect.topleft),
+        ]
+        blits.extend(self._lives_blits())
+        return blits
@@ -0,0 +1,118 @@
+"""
+Particles module for Alien Invasion.
+
+Explosion particles stored in fixed-size NumPy arrays, updated all at once
+and drawn in a single batch.
+"""
+import numpy as np
+import pygame
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+
+class ParticleEmitter:
+    """
+    Class to manage explosion particles.
+    """
+    def __init__(self, game: 'AlienInvasion'):
+        """
+        Initializes the emitter, its particle arrays and particle images.
+
+        Args:
+            game (AlienInvasion): Main game.
+        """
+        self.game = game
+        self.settings = game.settings
+        self.rng = np.random.default_rng()
+
+        capacity = self.settings.particle_capacity
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int32)
+        self.count = 0
+        self.burst_size = self.settings.particle_burst
+
+        self._setup_images()
+
+    def _setup_images(self):
+        """
+        Cuts the glow sprite out of the particle sheet and pre-scales one frame
+        per stage of a particle's life.
+        """
+        sheet = pygame.image.load(self.settings.particle_file).convert_alpha()
+        image = sheet.subsurface(self.settings.particle_rect)
+        frame_count = self.settings.particle_frames
+        size = self.settings.particle_size
+        self.frames = []
+        half_sizes = []
+        for frame in range(1, frame_count + 1):
+            frame_size = max(1, size * frame // frame_count)
+            self.frames.append(pygame.transform.smoothscale(image, (frame_size, frame_size)))
+            half_sizes.append(frame_size // 2)
+        self.half_sizes = np.array(half_sizes, dtype=np.float32)
+
+    def burst(self, center):
+        """
+        Spawns a burst of particles, dropping any that do not fit.
+
+        Args:
+            center (tuple): Center of the explosion.
+        """
+        start = self.count
+        amount = min(self.burst_size, len(self.life) - start)
+        if amount <= 0:
+            return
+        end = start + amount
+
+        angles = self.rng.uniform(0, 2 * np.pi, amount)
+        speeds = self.rng.uniform(0.5, 1.0, amount) * self.settings.particle_speed
+        self.pos[start:end] = center
+        self.vel[start:end, 0] = np.cos(angles) * speeds
+        self.vel[start:end, 1] = np.sin(angles) * speeds
+        self.life[start:end] = self.rng.integers(
+            self.settings.particle_lifetime // 2, self.settings.particle_lifetime + 1, amount)
+        self.count = end
+
+    def update(self):
+        """
+        Moves all live particles and removes the ones that have expired.
+        """
+        count = self.count
+        if not count:
+            return
+        self.pos[:count] += self.vel[:count]
+        self.vel[:count] *= self.settings.particle_drag
+        self.life[:count] -= 1
+
+        alive = self.life[:count] > 0
+        live_count = int(np.count_nonzero(alive))
+        if live_count < count:
+            self.pos[:live_count] = self.pos[:count][alive]
+            self.vel[:live_count] = self.vel[:count][alive]
+            self.life[:live_count] = self.life[:count][alive]
+            self.count = live_count
+
+    def empty(self):
+        """
+        Removes all particles.
+        """
+        self.count = 0
+
+    def blits(self):
+        """
+        Lists what to draw for all live particles.
+
+        Returns:
+            list: (image, position) pairs.
+        """
+        count = self.count
+        if not count:
+            return []
+        frame_count = len(self.frames)
+        stage = np.minimum(
+            self.life[:count] * frame_count // self.settings.particle_lifetime, frame_count - 1)
+        corners = self.pos[:count] - self.half_sizes[stage][:, None]
+        frames = self.frames
+        return [(frames[i], xy) for i, xy in zip(stage.tolist(), corners.tolist())]
@@ -0,0 +1,223 @@
+"""
+Save State module for Alien Invasion.
+
+Packs the full game state into a small binary snapshot and restores it by
+repositioning the sprites that already exist, only creating or removing the
+difference. Used for checkpoints to resume after a crash, and for tests that
+need to rewind or start at a given level.
+"""
+import struct
+from array import array
+from typing import TYPE_CHECKING
+
+from alien import Alien
+from bullet import Bullet
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+MAGIC = b'AISS'
+VERSION = 2
+HEADER = struct.Struct('<4sHiiqqqid?III')
+DYNAMIC_SETTINGS = (
+    'ship_speed', 'bullet_speed', 'fleet_speed',
+    'enemy_bullet_speed', 'alien_fire_chance',
+)
+
+
+def take_snapshot(game: 'AlienInvasion'):
+    """
+    Packs the game state into bytes.
+
+    Args:
+        game (AlienInvasion): Main game.
+
+    Returns:
+        bytes: The snapshot.
+    """
+    stats = game.game_stats
+    fleet = game.alien_fleet
+    aliens = fleet.fleet.sprites()
+    bullets = game.ship.arsenal.arsenal.sprites()
+    enemy_bullets = fleet.arsenal.arsenal.sprites()
+
+    values = array('d', (getattr(game.settings, name) for name in DYNAMIC_SETTINGS))
+    for alien in aliens:
+        values.extend((alien.x, alien.y, alien.col, alien.row))
+    for bullet in bullets:
+        values.extend((bullet.rect.x, bullet.y))
+    for bullet in enemy_bullets:
+        values.extend((bullet.rect.x, bullet.y))
+
+    header = HEADER.pack(
+        MAGIC, VERSION, stats.level, stats.ships_left, stats.score,
+        stats.max_score, stats.hi_score, fleet.fleet_direction, game.ship.x,
+        fleet.spawn_queue is not None, len(aliens), len(bullets), len(enemy_bullets),
+    )
+    return header + values.tobytes()
+
+
+def restore_snapshot(game: 'AlienInvasion', data):
+    """
+    Restores the game state from a snapshot.
+
+    If the snapshot was taken while the fleet was still spawning, the fleet
+    for the restored level is spawned again instead.
+
+    Args:
+        game (AlienInvasion): Main game.
+        data (bytes): A snapshot from take_snapshot.
+    """
+    (magic, version, level, ships_left, score, max_score, hi_score,
+     fleet_direction, ship_x, spawning, alien_count, bullet_count,
+     enemy_bullet_count) = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('Not a compatible Alien Invasion snapshot')
+    values = array('d')
+    values.frombytes(data[HEADER.size:])
+
+    stats = game.game_stats
+    stats.level = level
+    stats.ships_left = ships_left
+    stats.score = score
+    stats.max_score = max_score
+    stats.hi_score = max(stats.hi_score, hi_score)
+    for index, name in enumerate(DYNAMIC_SETTINGS):
+        setattr(game.settings, name, values[index])
+    offset = len(DYNAMIC_SETTINGS)
+
+    ship = game.ship
+    ship.x = ship_x
+    ship.rect.x = ship_x
+
+    fleet = game.alien_fleet
+    fleet.fleet_direction = fleet_direction
+    if spawning:
+        fleet.create_fleet()
+    else:
+        _restore_aliens(game, values[offset:offset + alien_count * 4])
+    offset += alien_count * 4
+
+    _restore_bullets(game, values[offset:offset + bullet_count * 2])
+    offset += bullet_count * 2
+    _restore_enemy_bullets(game, values[offset:offset + enemy_bullet_count * 2])
+
+    game.particles.empty()
+    game.HUD.update_scores()
+    game.HUD.update_level()
+
+
+def _restore_aliens(game: 'AlienInvasion', values):
+    """
+    Moves existing aliens into place, creating or removing aliens as needed.
+
+    Args:
+        game (AlienInvasion): Main game.
+        values (array): x, y, column and row for each alien.
+    """
+    fleet = game.alien_fleet
+    aliens = fleet.fleet.sprites()
+    fleet.spawn_queue = None
+    fleet.columns = {}
+    fleet.tier = fleet.level_tier(game.game_stats.level)
+    for index in range(len(values) // 4):
+        x, y, col, row = values[index * 4:index * 4 + 4]
+        image = fleet.alien_image(int(row))
+        if index < len(aliens):
+            alien = aliens[index]
+            alien.image = image
+            alien.rect.size = image.get_size()
+        else:
+            alien = Alien(fleet, x, y, image)
+            fleet.fleet.add(alien)
+        alien.x, alien.y, alien.col, alien.row = x, y, int(col), int(row)
+        alien.rect.x = x
+        alien.rect.y = y
+        fleet.columns.setdefault(alien.col, []).append(alien)
+    for alien in aliens[len(values) // 4:]:
+        fleet.fleet.remove(alien)
+    for column in fleet.columns.values():
+        column.sort(key=lambda alien: alien.y)
+
+
+def _restore_bullets(game: 'AlienInvasion', values):
+    """
+    Moves existing ship bullets into place, creating or removing bullets as needed.
+
+    Args:
+        game (AlienInvasion): Main game.
+        values (array): x and y for each bullet.
+    """
+    arsenal = game.ship.arsenal.arsenal
+    bullets = arsenal.sprites()
+    for index in range(len(values) // 2):
+        if index < len(bullets):
+            bullet = bullets[index]
+        else:
+            bullet = Bullet(game)
+            arsenal.add(bullet)
+        bullet.rect.x = values[index * 2]
+        bullet.y = values[index * 2 + 1]
+        bullet.rect.y = bullet.y
+    for bullet in bullets[len(values) // 2:]:
+        arsenal.remove(bullet)
+
+
+def _restore_enemy_bullets(game: 'AlienInvasion', values):
+    """
+    Takes enemy bullets from the pool and moves them into place.
+
+    Args:
+        game (AlienInvasion): Main game.
+        values (array): x and y for each enemy bullet.
+    """
+    enemy_arsenal = game.alien_fleet.arsenal
+    enemy_arsenal.empty()
+    half_w = game.settings.enemy_bullet_w // 2
+    for index in range(len(values) // 2):
+        enemy_arsenal.fire_bullet((values[index * 2] + half_w, values[index * 2 + 1]))
+
+
+def save_checkpoint(game: 'AlienInvasion'):
+    """
+    Writes a snapshot to the checkpoint file.
+
+    Args:
+        game (AlienInvasion): Main game.
+    """
+    try:
+        game.settings.checkpoint_file.write_bytes(take_snapshot(game))
+    except OSError as e:
+        print(f'Could not save checkpoint: {e}')
+
+
+def load_checkpoint(game: 'AlienInvasion', path=None):
+    """
+    Restores the game from a checkpoint file if there is one.
+
+    Args:
+        game (AlienInvasion): Main game.
+        path (Path): Checkpoint to load, defaults to the checkpoint file in settings.
+
+    Returns:
+        bool: True if a checkpoint was restored.
+    """
+    path = path or game.settings.checkpoint_file
+    if not path.exists():
+        return False
+    try:
+        restore_snapshot(game, path.read_bytes())
+    except (OSError, ValueError, struct.error) as e:
+        print(f'Could not load checkpoint: {e}')
+        return False
+    return True
+
+
+def clear_checkpoint(game: 'AlienInvasion'):
+    """
+    Removes the checkpoint file.
+
+    Args:
+        game (AlienInvasion): Main game.
+    """
+    game.settings.checkpoint_file.unlink(missing_ok=True)
@@ -5,6 +5,8 @@ Static and dynamic game settings, such as screen size, asset paths, and difficul
 """
 from pathlib import Path
 
+ASSETS = Path(__file__).resolve().parent / 'Assets'
+
 class Settings:
     """
     Stores all settings for Alien Invasion
@@ -18,31 +20,103 @@ class Settings:
         self.screen_w = 1200
         self.screen_h = 800
         self.FPS = 60
-        self.bg_file = Path.cwd() / 'Assets' / 'images' / 'spaceBG.jpg'
+        self.death_pause = 0.5
+        self.pipelined = False
+        self.display_scaled = True
+        self.window_w = 1200
+        self.window_h = 800
+        self.bg_file = ASSETS / 'images' / 'spaceBG.jpg'
+        self.asteroid_file = ASSETS / 'images' / 'Asteroid Brown.png'
+        # (file, tile size, tile period, speed, alpha, mirrored), back to front
+        self.bg_layers = (
+            (self.bg_file, (self.screen_w, self.screen_h), (self.screen_w, self.screen_h * 2), 0.25, False, True),
+            (self.asteroid_file, (48, 48), (420, 330), 1.2, True, False),
+        )
         self.difficulty_scale = 1.1
-        self.scores_file = Path.cwd() / 'Assets' / 'file' / 'scores.json'
+        self.scores_file = ASSETS / 'file' / 'scores.json'
+        self.checkpoints = True
+        self.checkpoint_file = ASSETS / 'file' / 'checkpoint.bin'
+
+        self.quality_governor = True
+        self.quality_smoothing = 0.1
+        self.quality_down_ratio = 0.9
+        self.quality_up_ratio = 0.5
+        self.quality_down_frames = 30
+        self.quality_up_frames = 180
+        # (particle scale, background layers, HUD refresh frames, impact sound cooldown ms), lowest first
+        self.quality_levels = (
+            (0.0, 1, 30, 500),
+            (0.25, 1, 15, 250),
+            (0.5, len(self.bg_layers), 5, 100),
+            (1.0, len(self.bg_layers), 1, 0),
+        )
+
+        self.gc_control = True
+        self.gc_slack_ms = 6
+        self.gc_force_factor = 10
+        self.gc_pause_history = 1000
+
+        self.analytics = False
+        self.analytics_file = ASSETS / 'file' / 'analytics.ndjson.gz'
+        self.analytics_buffer = 4096
+        self.analytics_batch = 512
+        self.analytics_interval = 5
 
-        self.ship_file = Path.cwd() / 'Assets' / 'images' / 'PurpleShip.png'
+        self.diagnostics = False
+        self.diagnostics_file = ASSETS / 'file' / 'diagnostics.log'
+        self.diagnostics_interval = 10
+        self.diagnostics_window = 6
+        self.diagnostics_growth = 0.2
+        self.diagnostics_classes = ('Alien', 'Bullet', 'EnemyBullet', 'Surface')
+
+        self.ship_file = ASSETS / 'images' / 'PurpleShip.png'
         self.ship_file_w = 40
         self.ship_file_h = 60
 
-        self.bullet_file = Path.cwd() / 'Assets' / 'images' / 'blueLaser.png'
-        self.laser_sound = Path.cwd() / 'Assets' / 'sound' / 'scifiLaser.mp3'
-        self.impact_sound = Path.cwd() / 'Assets' / 'sound' / 'boomSound.mp3'
+        self.bullet_file = ASSETS / 'images' / 'blueLaser.png'
+        self.laser_sound = ASSETS / 'sound' / 'scifiLaser.mp3'
+        self.impact_sound = ASSETS / 'sound' / 'boomSound.mp3'
         self.bullet_w = 25
         self.bullet_h = 80
 
-        self.alien_file = Path.cwd() / 'Assets' / 'images' / 'alienSS.png'
+        self.enemy_bullet_file = ASSETS / 'images' / 'laserBlast.png'
+        self.enemy_bullet_w = 12
+        self.enemy_bullet_h = 24
+        self.enemy_bullet_amount = 300
+
+        self.alien_file = ASSETS / 'images' / 'alienSS.png'
         self.alien_w = 40
         self.alien_h = 40
+        self.enemy_file = ASSETS / 'images' / 'enemy_4.png'
         self.fleet_direction = 1
+        # Levels per tier; each tier lists (file, tint, scale) variants used row by row
+        self.alien_tier_levels = 3
+        self.alien_tiers = (
+            ((self.alien_file, None, 1.0),),
+            ((self.alien_file, None, 1.0), (self.alien_file, (255, 150, 150), 1.0)),
+            ((self.enemy_file, None, 0.9), (self.alien_file, (150, 200, 255), 1.0)),
+            ((self.enemy_file, (255, 210, 120), 1.0), (self.enemy_file, (200, 150, 255), 0.9),
+             (self.alien_file, (255, 120, 120), 1.0)),
+        )
+        self.fleet_formations = ('cross', 'rectangle', 'diamond', 'procedural')
+        self.fleet_spawn_rate = 8
+
+        self.particle_file = ASSETS / 'images' / 'beams.png'
+        self.particle_rect = (201, 2, 18, 17)
+        self.particle_capacity = 4096
+        self.particle_burst = 40
+        self.particle_lifetime = 30
+        self.particle_speed = 4
+        self.particle_drag = 0.92
+        self.particle_size = 12
+        self.particle_frames = 4
 
         self.button_color = (0,135,50)
 
         self.text_color = (255,255,255)
         self.button_font_size = 48
         self.HUD_font_size = 20
-        self.font_file = Path.cwd() / 'Assets' / 'Fonts' / 'Silkscreen' / 'Iceberg-Regular.ttf'
+        self.font_file = ASSETS / 'Fonts' / 'Silkscreen' / 'Iceberg-Regular.ttf'
         
 
     def initialize_dynamic_settings(self):
@@ -55,6 +129,8 @@ class Settings:
             self.bullet_amount = 5
             self.fleet_speed = 1
             self.fleet_drop_speed = 40
+            self.enemy_bullet_speed = 4
+            self.alien_fire_chance = 0.02
             self.button_w = 200
             self.button_h = 50
             self.alien_points = 50
@@ -66,5 +142,7 @@ class Settings:
          self.ship_speed *= self.difficulty_scale
          self.bullet_speed *= self.difficulty_scale
          self.fleet_speed *= self.difficulty_scale
+         self.enemy_bullet_speed *= self.difficulty_scale
+         self.alien_fire_chance *= self.difficulty_scale
 
         
@@ -29,8 +29,7 @@ class Ship:
         self.boundaries = self.screen.get_rect()
 
 
-        self.image = pygame.image.load(self.settings.ship_file)
-        self.image = pygame.transform.scale(self.image, 
+        self.image = game.display.images.get(self.settings.ship_file,
             (self.settings.ship_file_w, self.settings.ship_file_h)
             )
         
@@ -68,12 +67,16 @@ class Ship:
         
         self.rect.x = self.x
      
-    def draw(self):
+    def blits(self):
         """
-        Draw the ship.
+        Lists what to draw for the ship and its bullets.
+
+        Returns:
+            list: (image, position) pairs.
         """
-        self.arsenal.draw()
-        self.screen.blit(self.image, self.rect)
+        blits = self.arsenal.blits()
+        blits.append((self.image, self.rect.topleft))
+        return blits
 
     def fire(self):
         """
@@ -0,0 +1,149 @@
+"""
+Soak test runner for Alien Invasion.
+
+Plays the game with a bot for a set amount of time, restarting whenever the
+game ends, and reports frame-time statistics per level at the end.
+
+Example:
+    python soak.py --bot aim --minutes 180 --headless
+"""
+import argparse
+import os
+import statistics
+import sys
+from array import array
+from pathlib import Path
+from time import perf_counter
+
+
+def parse_args():
+    """
+    Reads the command line options.
+
+    Returns:
+        argparse.Namespace: The options.
+    """
+    parser = argparse.ArgumentParser(description='Soak test Alien Invasion with a bot.')
+    parser.add_argument('--bot', default='greedy', help='random, greedy or aim')
+    parser.add_argument('--minutes', type=float, default=1.0, help='How long to run for.')
+    parser.add_argument('--seed', type=int, default=None, help='Seed for the random bot.')
+    parser.add_argument('--headless', action='store_true', help='Run without a window or audio device.')
+    parser.add_argument('--uncapped', action='store_true', help='Do not limit the frame rate.')
+    parser.add_argument('--diagnostics', action='store_true', help='Track memory use and GC pauses.')
+    parser.add_argument('--checkpoint', type=Path, default=None, help='Snapshot to start the first game from.')
+    return parser.parse_args()
+
+
+def run_soak(game, bot, minutes, uncapped, checkpoint=None):
+    """
+    Plays the game with the bot and records how long each frame took.
+
+    Frames in which diagnostics took a sample are left out of the times.
+
+    Args:
+        game (AlienInvasion): Main game.
+        bot (Bot): Bot playing the game.
+        minutes (float): How long to run for.
+        uncapped (bool): Run frames back to back instead of at settings.FPS.
+        checkpoint (bytes): Snapshot to start the first game from.
+
+    Returns:
+        tuple: (frame times in ms per level, all frame times in ms, games played,
+            frames left out for diagnostics)
+    """
+    from savestate import restore_snapshot
+
+    game.bot = bot
+    game.settings.death_pause = 0
+    game.settings.checkpoints = False
+    frame_times = {}
+    all_times = array('d')
+    games = 0
+    skipped = 0
+    end = perf_counter() + minutes * 60
+
+    while perf_counter() < end:
+        if not game.game_active:
+            game.restart_game()
+            if checkpoint and not games:
+                restore_snapshot(game, checkpoint)
+            games += 1
+        level = game.game_stats.level
+        samples = game.diagnostics.samples if game.diagnostics else 0
+        start = perf_counter()
+        game._run_frame()
+        elapsed = (perf_counter() - start) * 1000
+        game._frame_done(elapsed / 1000)
+        if game.diagnostics and game.diagnostics.samples != samples:
+            skipped += 1
+        else:
+            frame_times.setdefault(level, array('d')).append(elapsed)
+            all_times.append(elapsed)
+        if not uncapped:
+            game.clock.tick(game.settings.FPS)
+    return frame_times, all_times, games, skipped
+
+
+def report(frame_times, all_times, games, skipped):
+    """
+    Prints frame-time statistics per level and the drift over the run.
+
+    Args:
+        frame_times (dict): Frame times in ms per level.
+        all_times (array): Every frame time in ms, in order.
+        games (int): Number of games played.
+        skipped (int): Frames left out because diagnostics took a sample.
+    """
+    print(f'{games} games, {len(all_times)} frames')
+    if skipped:
+        print(f'{skipped} frames with a diagnostics sample left out')
+    print(f'{"level":>5} {"frames":>8} {"mean":>7} {"p50":>7} {"p95":>7} {"p99":>7} {"max":>7}')
+    for level in sorted(frame_times):
+        times = frame_times[level]
+        if len(times) > 1:
+            cuts = statistics.quantiles(times, n=100)
+            p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+        else:
+            p50 = p95 = p99 = times[0]
+        print(f'{level:>5} {len(times):>8} {statistics.fmean(times):>7.2f} '
+              f'{p50:>7.2f} {p95:>7.2f} {p99:>7.2f} {max(times):>7.2f}')
+
+    tenth = len(all_times) // 10
+    if tenth:
+        first = statistics.fmean(all_times[:tenth])
+        last = statistics.fmean(all_times[-tenth:])
+        print(f'drift: first 10% {first:.2f} ms, last 10% {last:.2f} ms')
+
+
+def main():
+    """
+    Runs the soak test from the command line.
+    """
+    args = parse_args()
+    if args.headless:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+    from alien_invasion import AlienInvasion
+    from bots import BOTS, RandomBot
+    from diagnostics import MemoryTracker
+
+    if args.bot not in BOTS:
+        sys.exit(f'Unknown bot: {args.bot}')
+    bot = RandomBot(args.seed) if BOTS[args.bot] is RandomBot else BOTS[args.bot]()
+
+    game = AlienInvasion()
+    if args.diagnostics:
+        game.diagnostics = MemoryTracker(game)
+    checkpoint = args.checkpoint.read_bytes() if args.checkpoint else None
+    report(*run_soak(game, bot, args.minutes, args.uncapped, checkpoint))
+    if game.gc_control:
+        print(game.gc_control.summary())
+    if game.governor:
+        print(f'quality level: {game.governor.level}')
+    if game.diagnostics:
+        game.diagnostics.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Startup module for Alien Invasion.
+
+Times each phase of startup, from the first import until the first frame is
+on screen, and prints a breakdown in the style of python -X importtime.
+"""
+from time import perf_counter
+
+
+class StartupTimer:
+    """
+    Records how long each startup phase took.
+    """
+    def __init__(self):
+        """
+        Starts timing.
+        """
+        self.start = perf_counter()
+        self.last = self.start
+        self.phases = []
+
+    def mark(self, phase):
+        """
+        Ends a phase.
+
+        Args:
+            phase (str): Name of the phase that just finished.
+        """
+        now = perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def report(self):
+        """
+        Prints each phase with its own and cumulative time in milliseconds.
+        """
+        print('startup: self [ms] | cumulative | phase')
+        total = 0.0
+        for phase, seconds in self.phases:
+            total += seconds
+            print(f'startup: {seconds * 1000:9.1f} | {total * 1000:10.1f} | {phase}')
+
+
+startup_timer = StartupTimer()